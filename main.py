@@ -15,24 +15,104 @@ See docs/plan.md and docs/tasks.md for the improvement plan.
 
 from __future__ import annotations
 
+import contextlib
+import ipaddress
 import json
 import logging
 import os
 import random
+import socket
 import sys
+import threading
 import time
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterator, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+
+try:
+    import orjson  # type: ignore
+except ImportError:  # optional speedup; the stdlib json module is used otherwise
+    orjson = None
 
 
 logger = logging.getLogger(__name__)
 
 
+if orjson is not None:
+    _loads = orjson.loads
+
+    def _dumps_pretty(data: Any) -> str:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+else:
+    _loads = json.loads
+
+    def _dumps_pretty(data: Any) -> str:
+        return json.dumps(data, indent=4)
+
+
+def _decode(resp: requests.Response) -> Any:
+    """Parse a bridge response body.
+
+    Decode failures raise requests.exceptions.JSONDecodeError, as resp.json() does, so
+    callers catching RequestException (or ValueError) still handle a non-JSON body.
+    """
+    try:
+        return _loads(resp.content)
+    except json.JSONDecodeError as e:
+        raise requests.exceptions.JSONDecodeError(e.msg, e.doc, e.pos) from e
+
+
+# urllib3's defaults (TCP_NODELAY) plus SO_KEEPALIVE, so idle keep-alive connections
+# to the bridge are probed rather than silently dropped.
+_SOCKET_OPTIONS = HTTPConnection.default_socket_options + [
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+]
+
+
+class _BridgeHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter that applies _SOCKET_OPTIONS to every pooled connection."""
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        kwargs.setdefault("socket_options", _SOCKET_OPTIONS)
+        super().init_poolmanager(*args, **kwargs)
+
+
+def _new_session(pool_connections: int = 1, pool_maxsize: int = 1) -> requests.Session:
+    """Create a requests.Session with a keep-alive connection pool for the bridge.
+
+    Creating a session performs no network I/O.
+    """
+    session = requests.Session()
+    session.mount(
+        "http://",
+        _BridgeHTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=0),
+    )
+    return session
+
+
+# Shared HTTP session so repeated calls to the bridge reuse keep-alive connections
+# instead of paying a TCP handshake per request. Mood threads use their own sessions.
+_SESSION = _new_session(pool_connections=4, pool_maxsize=16)
+
+
+_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+}
+
+
 def setup_logging(level_str: str | None) -> None:
-    level_name = (level_str or "INFO").upper()
-    level = getattr(logging, level_name, logging.INFO)
-    logging.basicConfig(level=level, format="%(levelname)s %(name)s: %(message)s")
+    """Configure root logging; repeated calls update the level instead of being ignored."""
+    level = _LEVELS.get((level_str or "INFO").upper(), logging.INFO)
+    if logging.root.handlers:
+        logging.root.setLevel(level)
+    else:
+        logging.basicConfig(level=level, format="%(levelname)s %(name)s: %(message)s")
 
 
 def _redact_user_id(user_id: str) -> str:
@@ -41,6 +121,58 @@ def _redact_user_id(user_id: str) -> str:
     return f"***{user_id[-4:]}" if len(user_id) > 4 else "***"
 
 
+# Bridge hostname -> address it resolved to (or the hostname itself if resolution failed).
+_RESOLVED_HOSTS: Dict[str, str] = {}
+
+
+def _resolve_bridge_host(bridge_ip: str) -> str:
+    """Return bridge_ip as an IP address, resolving a hostname only once per process.
+
+    Falls back to the original value if resolution fails, leaving lookup to requests.
+    """
+    try:
+        ipaddress.ip_address(bridge_ip)
+        return bridge_ip
+    except ValueError:
+        pass
+    resolved = _RESOLVED_HOSTS.get(bridge_ip)
+    if resolved is not None:
+        return resolved
+    try:
+        resolved = socket.gethostbyname(bridge_ip)
+        logger.debug("Resolved bridge host %s to %s", bridge_ip, resolved)
+    except OSError as e:
+        logger.warning("Could not resolve HUE_BRIDGE_IP=%s (%s); using it as given", bridge_ip, e)
+        resolved = bridge_ip
+    _RESOLVED_HOSTS[bridge_ip] = resolved
+    return resolved
+
+
+def _pin_host_header(session: requests.Session, bridge_ip: str, bridge_host: str) -> None:
+    """Keep the configured bridge hostname in the Host header when connecting by resolved IP."""
+    if bridge_host != bridge_ip:
+        session.headers["Host"] = bridge_ip
+
+
+@contextlib.contextmanager
+def _bridge_session(bridge_ip: str, bridge_host: str) -> Iterator[requests.Session]:
+    """Yield the session to reach the bridge at bridge_host with.
+
+    That is the shared session, unless bridge_ip is a hostname that was resolved to
+    bridge_host; then a short-lived session carries the Host header so the shared
+    one is never modified.
+    """
+    if bridge_host == bridge_ip:
+        yield _SESSION
+        return
+    session = _new_session()
+    _pin_host_header(session, bridge_ip, bridge_host)
+    try:
+        yield session
+    finally:
+        session.close()
+
+
 def load_config() -> Dict[str, Any]:
     """Load configuration from environment with defaults.
 
@@ -69,14 +201,16 @@ def build_base_url(user_id: str, bridge_ip: str) -> str:
     return f"http://{bridge_ip}/api/{user_id}/"
 
 
-def fetch_bridge_state(base_url: str, timeout: float = 5.0) -> Any:
+def fetch_bridge_state(
+    base_url: str, timeout: float = 5.0, *, session: Optional[requests.Session] = None
+) -> Any:
     """Fetch the Hue bridge root state and return parsed JSON.
 
     Raises requests.exceptions.RequestException on network issues and ValueError on JSON decoding.
     """
-    resp = requests.get(base_url, timeout=timeout)
+    resp = (session or _SESSION).get(base_url, timeout=timeout)
     try:
-        return resp.json()
+        return _decode(resp)
     except ValueError as e:
         raise ValueError("Invalid JSON response from Hue Bridge") from e
 
@@ -89,33 +223,78 @@ def _endpoint(base_url: str, path: str) -> str:
     return base_url + path.lstrip('/')
 
 
-def get_lights(base_url: str, timeout: float = 5.0) -> Dict[str, Any]:
+def get_lights(
+    base_url: str, timeout: float = 5.0, *, session: Optional[requests.Session] = None
+) -> Dict[str, Any]:
     """Return the lights collection (mapping of id -> light info)."""
     url = _endpoint(base_url, "lights")
-    resp = requests.get(url, timeout=timeout)
-    return resp.json()
+    resp = (session or _SESSION).get(url, timeout=timeout)
+    return _decode(resp)
 
 
-def resolve_light_id_by_name(base_url: str, bulb_name: str, timeout: float = 5.0) -> Optional[str]:
-    """Resolve a light id by its human-readable name (case-insensitive)."""
-    lights = get_lights(base_url, timeout=timeout)
-    # lights is a dict of id -> {"name": ..., ...}
-    name_lower = bulb_name.strip().lower()
+# Name -> id index of each bridge's lights, keyed by base URL.
+_LIGHT_INDEX_CACHE: Dict[str, Dict[str, str]] = {}
+
+
+def _index_lights_by_name(lights: Dict[str, Any] | None) -> Dict[str, str]:
+    """Map lower-cased light names to light ids for a /lights collection."""
+    index: Dict[str, str] = {}
     for lid, info in (lights or {}).items():
-        try:
-            if str(info.get("name", "")).strip().lower() == name_lower:
-                return str(lid)
-        except AttributeError:
-            continue
-    return None
+        if isinstance(info, dict):
+            index.setdefault(str(info.get("name", "")).strip().lower(), str(lid))
+    return index
+
+
+def resolve_light_id_by_name(
+    base_url: str,
+    bulb_name: str,
+    timeout: float = 5.0,
+    *,
+    session: Optional[requests.Session] = None,
+) -> Optional[str]:
+    """Resolve a light id by its human-readable name (case-insensitive).
+
+    Uses the cached name index for base_url; /lights is fetched again only on a miss.
+    """
+    name_lower = bulb_name.strip().lower()
+    index = _LIGHT_INDEX_CACHE.get(base_url)
+    if index is None or name_lower not in index:
+        index = _index_lights_by_name(get_lights(base_url, timeout=timeout, session=session))
+        _LIGHT_INDEX_CACHE[base_url] = index
+    return index.get(name_lower)
+
+
+# Recently fetched light states keyed by lights/<id>/state URL: (monotonic fetch time, state).
+# Fields a PUT reports as successful are merged in so a read after a write doesn't need
+# the bridge; the fetch time is kept, so entries still expire while PUTs keep coming.
+_STATE_CACHE: Dict[str, tuple[float, Dict[str, Any]]] = {}
+_STATE_TTL = 2.0
+
+
+def get_light_state(
+    base_url: str,
+    light_id: str,
+    timeout: float = 5.0,
+    *,
+    session: Optional[requests.Session] = None,
+    max_age: float = _STATE_TTL,
+) -> Dict[str, Any]:
+    """Return a light's state, served from cache if it is younger than max_age seconds.
 
+    Pass max_age=0 to always query the bridge.
+    """
+    state_url = _endpoint(base_url, f"lights/{light_id}/state")
+    cached = _STATE_CACHE.get(state_url)
+    if cached is not None and time.monotonic() - cached[0] < max_age:
+        return dict(cached[1])
 
-def get_light_state(base_url: str, light_id: str, timeout: float = 5.0) -> Dict[str, Any]:
     url = _endpoint(base_url, f"lights/{light_id}")
-    resp = requests.get(url, timeout=timeout)
-    data = resp.json()
+    resp = (session or _SESSION).get(url, timeout=timeout)
+    data = _decode(resp)
     # Expected: {"state": {...}, ...}
     state = data.get("state", {}) if isinstance(data, dict) else {}
+    if isinstance(state, dict):
+        _STATE_CACHE[state_url] = (time.monotonic(), dict(state))
     return state
 
 
@@ -129,6 +308,7 @@ def set_light_state(
     sat: Optional[int] = None,
     transitiontime: Optional[int] = None,
     timeout: float = 5.0,
+    session: Optional[requests.Session] = None,
 ) -> Any:
     """PUT state to a Hue light. transitiontime is in 100ms units if provided."""
     payload: Dict[str, Any] = {}
@@ -144,15 +324,39 @@ def set_light_state(
         payload["transitiontime"] = int(max(0, transitiontime))
 
     url = _endpoint(base_url, f"lights/{light_id}/state")
-    resp = requests.put(url, json=payload, timeout=timeout)
+    return _put_state(session or _SESSION, url, payload, timeout)
+
+
+def _put_state(session: requests.Session, state_url: str, payload: Dict[str, Any], timeout: float) -> Any:
+    """PUT a prepared payload to a full lights/<id>/state URL and return the parsed reply."""
+    resp = session.put(state_url, json=payload, timeout=timeout)
     try:
-        return resp.json()
+        reply = _loads(resp.content)
     except ValueError:
         return None
+    cached = _STATE_CACHE.get(state_url)
+    if cached is not None and 200 <= resp.status_code < 300:
+        confirmed = _successful_fields(reply)
+        if confirmed:
+            _STATE_CACHE[state_url] = (cached[0], {**cached[1], **confirmed})
+    return reply
+
 
+def _successful_fields(reply: Any) -> Dict[str, Any]:
+    """Return the state fields a PUT reply reports under "success".
 
-def _clamp(v: float, lo: float, hi: float) -> float:
-    return max(lo, min(hi, v))
+    The bridge answers with e.g. [{"success": {"/lights/1/state/bri": 200}}, {"error": {...}}].
+    """
+    fields: Dict[str, Any] = {}
+    if not isinstance(reply, list):
+        return fields
+    for item in reply:
+        success = item.get("success") if isinstance(item, dict) else None
+        if isinstance(success, dict):
+            for path, value in success.items():
+                fields[str(path).rsplit("/", 1)[-1]] = value
+    fields.pop("transitiontime", None)
+    return fields
 
 
 def _get_mood_max_seconds(default: float = 30.0) -> float:
@@ -215,14 +419,16 @@ def _get_mood_max_seconds(default: float = 30.0) -> float:
 def mood(
     bulb_name: str,
     *,
-    stop_event: Optional["threading.Event"] = None,
+    stop_event: Optional[threading.Event] = None,
     restore_on_exit: bool = True,
+    light_id: Optional[str] = None,
 ) -> None:
     """Run a real-time random dynamic mood lighting loop for the given bulb name.
 
     This function is designed to be used as a thread target. It will run indefinitely
     until asked to stop via stop_event. It reads configuration from environment via
     load_config() at call time and performs no network at import time.
+    If light_id is given, the name lookup against the bridge is skipped.
     """
     cfg = load_config()
     user_id = cfg.get("user_id")
@@ -232,22 +438,61 @@ def mood(
     if not user_id:
         raise RuntimeError("HUE_USER_ID is required to run mood()")
 
-    base_url = build_base_url(user_id, bridge_ip)
+    bridge_host = _resolve_bridge_host(bridge_ip)
+    base_url = build_base_url(user_id, bridge_host)
+
+    # Always have an event to wait on so transitions can be interrupted promptly
+    if stop_event is None:
+        stop_event = threading.Event()
 
-    # Resolve light id by name
+    # Each mood thread owns its session (and its single keep-alive connection) so
+    # threads never contend on a shared connection pool.
+    session = _new_session()
+    _pin_host_header(session, bridge_ip, bridge_host)
     try:
-        light_id = resolve_light_id_by_name(base_url, bulb_name, timeout=timeout)
-    except requests.exceptions.RequestException as e:
-        logger.error("Failed to fetch lights from Hue Bridge: %s", e)
-        return
+        _run_mood(
+            bulb_name,
+            base_url,
+            session,
+            timeout=timeout,
+            stop_event=stop_event,
+            restore_on_exit=restore_on_exit,
+            light_id=light_id,
+        )
+    finally:
+        session.close()
+
+
+def _run_mood(
+    bulb_name: str,
+    base_url: str,
+    session: requests.Session,
+    *,
+    timeout: float,
+    stop_event: threading.Event,
+    restore_on_exit: bool,
+    light_id: Optional[str] = None,
+) -> None:
+    """Body of mood(): resolve the light, then loop until stopped using the given session."""
+    # Resolve light id by name unless the caller already did
+    if not light_id:
+        try:
+            light_id = resolve_light_id_by_name(base_url, bulb_name, timeout=timeout, session=session)
+        except requests.exceptions.RequestException as e:
+            logger.error("Failed to fetch lights from Hue Bridge: %s", e)
+            return
 
     if not light_id:
         logger.error("Light named '%s' not found on the bridge", bulb_name)
         return
 
-    # Ensure the light is on and get its current state
+    # The state URL is fixed for this light; build it once for every PUT below
+    state_url = _endpoint(base_url, f"lights/{light_id}/state")
+
+    # Ensure the light is on and get its current state. This is what gets restored on
+    # exit, so always ask the bridge rather than trusting a cached copy.
     try:
-        state = get_light_state(base_url, light_id, timeout=timeout)
+        state = get_light_state(base_url, light_id, timeout=timeout, session=session, max_age=0)
     except requests.exceptions.RequestException as e:
         logger.error("Failed to get state for light %s: %s", light_id, e)
         return
@@ -262,7 +507,8 @@ def mood(
 
     if not is_on:
         try:
-            set_light_state(base_url, light_id, on=True, timeout=timeout)
+            with _bridge_slot():
+                _put_state(session, state_url, {"on": True}, timeout)
             is_on = True
         except requests.exceptions.RequestException as e:
             logger.error("Failed to turn on light %s: %s", light_id, e)
@@ -270,89 +516,130 @@ def mood(
 
     logger.info("Starting mood loop for '%s' (id=%s)", bulb_name, light_id)
 
-    try:
-        while True:
-            if stop_event is not None and stop_event.is_set():
-                break
+    # CLI/env settings are fixed for the life of the process; read them once.
+    max_seconds = _get_mood_max_seconds(30.0)
 
+    # Transitions are paced against deadlines so PUT latency doesn't stretch them
+    deadline = time.monotonic()
+
+    try:
+        while not stop_event.is_set():
             # 3. Generate random target color (hue/sat) and brightness
             tgt_hue = random.randint(0, 65535)
             tgt_sat = random.randint(150, 254)
             tgt_bri = random.randint(10, 254)
 
             # 4. Random transition time between 0.5 seconds and configured max (default 30.0)
-            max_seconds = _get_mood_max_seconds(30.0)
             t_seconds = random.uniform(0.5, max_seconds)
 
-            # 5. Number of 0.1s steps
-            steps = max(1, int(round(t_seconds / 0.1)))
-
-            # 6-7. Per-step increments
-            dhue = (tgt_hue - cur_hue) / steps
-            dsat = (tgt_sat - cur_sat) / steps
-            dbri = (tgt_bri - cur_bri) / steps
-
-            # 8-9. Loop applying incremental updates
-            for i in range(1, steps + 1):
-                if stop_event is not None and stop_event.is_set():
+            # 5-9. Let the bridge interpolate the whole transition in one request
+            # (transitiontime is in 100ms units) instead of micro-stepping client-side.
+            # transitiontime is a uint16 on the bridge; larger values are rejected.
+            transitiontime = min(65535, max(1, int(round(t_seconds * 10))))
+            deadline += t_seconds
+            payload = {
+                "on": True,
+                "bri": tgt_bri,
+                "hue": tgt_hue,
+                "sat": tgt_sat,
+                "transitiontime": transitiontime,
+            }
+            try:
+                with _bridge_slot():
+                    _put_state(session, state_url, payload, timeout)
+            except requests.exceptions.RequestException as e:
+                logger.warning("Transient error setting light state: %s", e)
+                # Continue with the next target after the wait
+
+            # Wait out the rest of the transition; a stop request interrupts the wait
+            remaining = deadline - time.monotonic()
+            if remaining > 0:
+                if stop_event.wait(remaining):
                     break
-                cur_hue = int(_clamp(round(cur_hue + dhue), 0, 65535))
-                cur_sat = int(_clamp(round(cur_sat + dsat), 0, 254))
-                cur_bri = int(_clamp(round(cur_bri + dbri), 1, 254))
-                try:
-                    set_light_state(
-                        base_url,
-                        light_id,
-                        on=True,
-                        bri=cur_bri,
-                        hue=cur_hue,
-                        sat=cur_sat,
-                        # Using bridge-side 100ms transition to smooth micro-steps if desired
-                        transitiontime=0,
-                        timeout=timeout,
-                    )
-                except requests.exceptions.RequestException as e:
-                    logger.warning("Transient error setting light state: %s", e)
-                    # Continue trying next step after sleep
-                time.sleep(0.1)
-
-            # If we broke early due to stop_event, exit outer loop too
-            if stop_event is not None and stop_event.is_set():
-                break
+            else:
+                # The PUT overran the transition; pace from now instead of bursting to catch up
+                deadline = time.monotonic()
 
-            # 10. Repeat with new random target (current already updated)
+            # 10. Repeat with new random target
             # Loop continues
     finally:
         # Attempt to restore original state when exiting the loop
         if restore_on_exit:
             try:
-                set_light_state(
-                    base_url,
-                    light_id,
-                    on=bool(orig_on),
-                    bri=int(orig_bri),
-                    hue=int(orig_hue),
-                    sat=int(orig_sat),
-                    transitiontime=0,
-                    timeout=timeout,
-                )
+                with _bridge_slot():
+                    set_light_state(
+                        base_url,
+                        light_id,
+                        on=orig_on,
+                        bri=orig_bri,
+                        hue=orig_hue,
+                        sat=orig_sat,
+                        transitiontime=0,
+                        timeout=timeout,
+                        session=session,
+                    )
                 logger.info("Restored '%s' (id=%s) to original state", bulb_name, light_id)
             except Exception as e:  # broader catch to ensure cleanup path doesn't raise
                 logger.warning("Failed to restore original state for light %s: %s", light_id, e)
 
 
-import threading
+# The bridge drops commands once too many requests are in flight or arrive too
+# quickly, so all mood threads share a cap on concurrent PUTs and a request rate.
+_MAX_IN_FLIGHT = 4
+_IN_FLIGHT = threading.BoundedSemaphore(_MAX_IN_FLIGHT)
+_MAX_PUTS_PER_SECOND = 20.0
+
+
+class _TokenBucket:
+    """Thread-safe token bucket: `rate` acquisitions per second, bursts up to `capacity`."""
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._stamp = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a token is available, then take it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._stamp) * self.rate)
+                self._stamp = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
 
-def start_mood_thread(bulb_name: str, stop_event: threading.Event | None = None) -> threading.Thread:
+_PUT_RATE = _TokenBucket(_MAX_PUTS_PER_SECOND, capacity=_MAX_IN_FLIGHT)
+
+
+@contextlib.contextmanager
+def _bridge_slot() -> Iterator[None]:
+    """Wait for the shared rate limit and an in-flight slot before talking to the bridge."""
+    _PUT_RATE.acquire()
+    with _IN_FLIGHT:
+        yield
+
+
+def start_mood_thread(
+    bulb_name: str,
+    stop_event: threading.Event | None = None,
+    light_id: str | None = None,
+) -> threading.Thread:
     """Start the mood() loop in a daemon thread and return the thread.
 
     If stop_event is provided, the thread will exit when the event is set and
-    the light will be restored to its original state.
+    the light will be restored to its original state. Passing an already
+    resolved light_id skips the per-thread lookup of the bulb name.
     """
     t = threading.Thread(
         target=mood,
         args=(bulb_name,),
-        kwargs={"stop_event": stop_event},
+        kwargs={"stop_event": stop_event, "light_id": light_id},
         name=f"mood-{bulb_name}",
         daemon=True,
     )
@@ -413,13 +700,20 @@ def _get_env_bulb_names() -> list[str] | None:
     return names or None
 
 
-def get_mood_bulb_names(base_url: str, timeout: float = 5.0) -> list[str]:
+def get_mood_bulb_names(
+    base_url: str,
+    timeout: float = 5.0,
+    *,
+    lights: Optional[Dict[str, Any]] = None,
+) -> list[str]:
     """Determine which bulb names to run mood on.
 
     Precedence:
     1) CLI (--bulbs/-b) if provided
     2) Environment (HUE_MOOD_BULBS)
     3) Default: bulbs of type "Extended color light" discovered from the bridge (via /lights)
+
+    An already fetched lights collection may be passed to avoid another request.
     """
     # 1) CLI
     cli = _get_cli_bulb_names()
@@ -436,11 +730,12 @@ def get_mood_bulb_names(base_url: str, timeout: float = 5.0) -> list[str]:
         return names
 
     # 3) Default to bulbs of type "Extended color light" discovered from the bridge
-    try:
-        lights = get_lights(base_url, timeout=timeout) or {}
-    except requests.exceptions.RequestException as e:
-        logger.error("Failed to list bulbs from Hue Bridge: %s", e)
-        return []
+    if lights is None:
+        try:
+            lights = get_lights(base_url, timeout=timeout) or {}
+        except requests.exceptions.RequestException as e:
+            logger.error("Failed to list bulbs from Hue Bridge: %s", e)
+            return []
 
     # Sort by numeric id for determinism
     def _id_key(item: tuple[str, Any]) -> int:
@@ -472,7 +767,7 @@ def _wait_for_escape_or_sigint() -> None:
     """Block until ESC is pressed or a KeyboardInterrupt (Ctrl-C) occurs.
 
     - On Windows uses msvcrt.kbhit/getwch.
-    - On POSIX terminals uses termios/tty with select for non-blocking key reads.
+    - On POSIX terminals uses termios/tty and blocks in a selector until a key arrives.
     - If stdin is not a TTY, falls back to waiting for KeyboardInterrupt.
     """
     try:
@@ -491,25 +786,31 @@ def _wait_for_escape_or_sigint() -> None:
                         return
                 time.sleep(0.1)
         else:
-            # POSIX
+            # POSIX: block without polling; Ctrl-C interrupts the wait
             import sys as _sys
-            import select as _select
+            import selectors as _selectors
+            import signal as _signal
             if not _sys.stdin.isatty():
-                # Not a TTY; wait for Ctrl-C
+                # Not a TTY; sleep until Ctrl-C
                 while True:
-                    time.sleep(0.2)
+                    _signal.pause()
             import termios as _termios
             import tty as _tty
             fd = _sys.stdin.fileno()
             old_settings = _termios.tcgetattr(fd)
             try:
                 _tty.setcbreak(fd)
-                while True:
-                    r, _, _ = _select.select([_sys.stdin], [], [], 0.1)
-                    if r:
+                with _selectors.DefaultSelector() as sel:
+                    sel.register(_sys.stdin, _selectors.EVENT_READ)
+                    while True:
+                        sel.select()
                         ch = _sys.stdin.read(1)
                         if ch == "\x1b":
                             return
+                        if not ch:
+                            # stdin closed; only Ctrl-C can stop us now
+                            while True:
+                                _signal.pause()
             finally:
                 _termios.tcsetattr(fd, _termios.TCSADRAIN, old_settings)
     except KeyboardInterrupt:
@@ -533,26 +834,49 @@ def run_mood_application() -> None:
         logger.error("HUE_USER_ID is not set; cannot start mood application.")
         return
 
-    base_url = build_base_url(user_id, bridge_ip)
+    bridge_host = _resolve_bridge_host(bridge_ip)
+    base_url = build_base_url(user_id, bridge_host)
+
+    # Fetch /lights once; it serves both bulb discovery and name -> id resolution
+    try:
+        with _bridge_session(bridge_ip, bridge_host) as session:
+            lights = get_lights(base_url, timeout=timeout, session=session) or {}
+    except requests.exceptions.RequestException as e:
+        logger.error("Failed to list bulbs from Hue Bridge: %s", e)
+        return
 
-    bulbs = get_mood_bulb_names(base_url, timeout=timeout)
+    bulbs = get_mood_bulb_names(base_url, timeout=timeout, lights=lights)
     if not bulbs:
         logger.warning("No bulbs available or specified; nothing to do.")
         return
 
+    index = _index_lights_by_name(lights)
+    _LIGHT_INDEX_CACHE[base_url] = index
+    resolved: list[tuple[str, str]] = []
+    for name in bulbs:
+        light_id = index.get(name.strip().lower())
+        if light_id is None:
+            logger.error("Light named '%s' not found on the bridge", name)
+            continue
+        resolved.append((name, light_id))
+    if not resolved:
+        logger.warning("None of the selected bulbs were found on the bridge; nothing to do.")
+        return
+
     stop_event = threading.Event()
     threads = []
-    for name in bulbs:
-        t = start_mood_thread(name, stop_event)
+    for name, light_id in resolved:
+        t = start_mood_thread(name, stop_event, light_id=light_id)
         threads.append(t)
-    logger.info("Mood threads started for bulbs: %s", ", ".join(bulbs))
+    logger.info("Mood threads started for bulbs: %s", ", ".join(name for name, _ in resolved))
     logger.info("Press ESC (or Ctrl-C) to stop and restore bulbs...")
     _wait_for_escape_or_sigint()
     logger.info("Stopping mood threads and restoring bulbs...")
     stop_event.set()
-    # Join threads briefly; they restore on exit
+    # A thread stopped mid-PUT may need to finish that request and then its restore
+    # request, each bounded by the timeout; give it both before giving up on it.
     for t in threads:
-        t.join(timeout=10.0)
+        t.join(timeout=2 * timeout + 1.0)
     logger.info("All mood threads stopped.")
 
 
@@ -575,12 +899,14 @@ def main() -> int:
     redacted_user = _redact_user_id(user_id)
     logger.debug("Effective configuration: bridge_ip=%s, user_id=%s, timeout=%s", bridge_ip, redacted_user, timeout)
 
-    base_url = build_base_url(user_id, bridge_ip)
+    bridge_host = _resolve_bridge_host(bridge_ip)
+    base_url = build_base_url(user_id, bridge_host)
     logger.info("Fetching Hue bridge state from http://%s/... (base path)", bridge_ip)
 
     try:
-        data = fetch_bridge_state(base_url, timeout=timeout)
-        pretty = json.dumps(data, indent=4)
+        with _bridge_session(bridge_ip, bridge_host) as session:
+            data = fetch_bridge_state(base_url, timeout=timeout, session=session)
+        pretty = _dumps_pretty(data)
         logger.info("%s", pretty)
         return 0
     except requests.exceptions.RequestException as e:
@@ -0,0 +1,60 @@
+import os
+from unittest.mock import Mock
+
+import pytest
+
+import main
+
+
+# Integration tests need a real bridge; don't even import them unless enabled
+collect_ignore = [] if os.getenv("INTEGRATION") == "1" else ["test_integration.py"]
+
+# Environment variables read by main.py; tests start with none of them set
+HUE_ENV_VARS = (
+    "HUE_USER_ID",
+    "HUE_BRIDGE_IP",
+    "REQUEST_TIMEOUT",
+    "LOG_LEVEL",
+    "HUE_MOOD_MAX_SECONDS",
+    "HUE_MOOD_BULBS",
+)
+
+
+@pytest.fixture(scope="session")
+def main_mod():
+    """The main module, resolved once per test session."""
+    return main
+
+
+@pytest.fixture(autouse=True)
+def clean_hue_env(request, monkeypatch):
+    # Integration tests talk to a real bridge and need its settings from the environment
+    if request.node.get_closest_marker("integration"):
+        return
+    for name in HUE_ENV_VARS:
+        monkeypatch.delenv(name, raising=False)
+
+
+@pytest.fixture(autouse=True)
+def clear_main_caches(main_mod):
+    """Drop cached light state, name indexes and host lookups so tests never see each other's data."""
+    yield
+    main_mod._STATE_CACHE.clear()
+    main_mod._LIGHT_INDEX_CACHE.clear()
+    main_mod._RESOLVED_HOSTS.clear()
+
+
+@pytest.fixture
+def mocked_requests_get(monkeypatch, main_mod):
+    """Replace GETs on main's shared session with a Mock and return it."""
+    mock_get = Mock()
+    monkeypatch.setattr(main_mod._SESSION, "get", mock_get)
+    return mock_get
+
+
+@pytest.fixture
+def mocked_requests_put(monkeypatch, main_mod):
+    """Replace PUTs on main's shared session with a Mock and return it."""
+    mock_put = Mock()
+    monkeypatch.setattr(main_mod._SESSION, "put", mock_put)
+    return mock_put
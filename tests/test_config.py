@@ -1,42 +1,91 @@
-import os
-import unittest
-from unittest.mock import patch
-import importlib
-
-import main
-
-
-class TestConfig(unittest.TestCase):
-    def test_defaults_when_env_missing(self):
-        with patch.dict(os.environ, {}, clear=True):
-            cfg = main.load_config()
-            self.assertIsNone(cfg["user_id"])  # not required at import
-            self.assertEqual(cfg["bridge_ip"], "192.168.1.2")
-            self.assertEqual(cfg["log_level"], "INFO")
-            self.assertEqual(cfg["timeout"], 5.0)
-
-    def test_overrides_and_timeout_parsing(self):
-        with patch.dict(
-            os.environ,
-            {
-                "HUE_USER_ID": "abc12345",
-                "HUE_BRIDGE_IP": "10.0.0.10",
-                "LOG_LEVEL": "DEBUG",
-                "REQUEST_TIMEOUT": "7.5",
-            },
-            clear=True,
-        ):
-            cfg = main.load_config()
-            self.assertEqual(cfg["user_id"], "abc12345")
-            self.assertEqual(cfg["bridge_ip"], "10.0.0.10")
-            self.assertEqual(cfg["log_level"], "DEBUG")
-            self.assertEqual(cfg["timeout"], 7.5)
-
-    def test_invalid_timeout_falls_back(self):
-        with patch.dict(os.environ, {"REQUEST_TIMEOUT": "abc"}, clear=True):
-            cfg = main.load_config()
-            self.assertEqual(cfg["timeout"], 5.0)
-
-
-if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+import logging
+from unittest.mock import Mock
+
+import pytest
+
+
+def test_defaults_when_env_missing(main_mod):
+    cfg = main_mod.load_config()
+    assert cfg["user_id"] is None  # not required at import
+    assert cfg["bridge_ip"] == "192.168.1.2"
+    assert cfg["log_level"] == "INFO"
+    assert cfg["timeout"] == 5.0
+
+
+def test_overrides_and_timeout_parsing(main_mod, monkeypatch):
+    monkeypatch.setenv("HUE_USER_ID", "abc12345")
+    monkeypatch.setenv("HUE_BRIDGE_IP", "10.0.0.10")
+    monkeypatch.setenv("LOG_LEVEL", "DEBUG")
+    monkeypatch.setenv("REQUEST_TIMEOUT", "7.5")
+
+    cfg = main_mod.load_config()
+    assert cfg["user_id"] == "abc12345"
+    assert cfg["bridge_ip"] == "10.0.0.10"
+    assert cfg["log_level"] == "DEBUG"
+    assert cfg["timeout"] == 7.5
+
+
+def test_invalid_timeout_falls_back(main_mod, monkeypatch):
+    monkeypatch.setenv("REQUEST_TIMEOUT", "abc")
+    cfg = main_mod.load_config()
+    assert cfg["timeout"] == 5.0
+
+
+def test_load_config_does_not_resolve_hostname(main_mod, monkeypatch):
+    monkeypatch.setenv("HUE_BRIDGE_IP", "hue.local")
+    mock_resolve = Mock()
+    monkeypatch.setattr(main_mod.socket, "gethostbyname", mock_resolve)
+
+    cfg = main_mod.load_config()
+    assert cfg["bridge_ip"] == "hue.local"
+    mock_resolve.assert_not_called()
+
+
+def test_ip_bridge_is_not_resolved(main_mod, monkeypatch):
+    mock_resolve = Mock()
+    monkeypatch.setattr(main_mod.socket, "gethostbyname", mock_resolve)
+
+    assert main_mod._resolve_bridge_host("10.0.0.10") == "10.0.0.10"
+    mock_resolve.assert_not_called()
+
+
+def test_hostname_bridge_is_resolved_once(main_mod, monkeypatch):
+    mock_resolve = Mock(return_value="10.0.0.42")
+    monkeypatch.setattr(main_mod.socket, "gethostbyname", mock_resolve)
+
+    assert main_mod._resolve_bridge_host("hue.local") == "10.0.0.42"
+    assert main_mod._resolve_bridge_host("hue.local") == "10.0.0.42"
+    assert mock_resolve.call_count == 1
+    args, kwargs = mock_resolve.call_args
+    assert args == ("hue.local",)
+    assert kwargs == {}
+
+
+def test_bridge_session_pins_host_without_touching_shared_session(main_mod):
+    with main_mod._bridge_session("hue.local", "10.0.0.42") as session:
+        assert session is not main_mod._SESSION
+        assert session.headers["Host"] == "hue.local"
+    assert "Host" not in main_mod._SESSION.headers
+
+    with main_mod._bridge_session("10.0.0.10", "10.0.0.10") as session:
+        assert session is main_mod._SESSION
+
+
+@pytest.fixture
+def restore_root_level():
+    root = logging.getLogger()
+    level = root.level
+    yield root
+    root.setLevel(level)
+
+
+def test_setup_logging_repeated_calls_update_level(main_mod, restore_root_level):
+    main_mod.setup_logging("DEBUG")
+    assert restore_root_level.level == logging.DEBUG
+    main_mod.setup_logging("warning")
+    assert restore_root_level.level == logging.WARNING
+
+
+def test_setup_logging_unknown_level_defaults_to_info(main_mod, restore_root_level):
+    main_mod.setup_logging("LOUD")
+    assert restore_root_level.level == logging.INFO
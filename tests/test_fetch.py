@@ -1,35 +1,31 @@
-import unittest
-from unittest.mock import patch, MagicMock
+from unittest.mock import Mock
 
+import pytest
 import requests
-import main
 
 
-class TestFetchBridgeState(unittest.TestCase):
-    @patch('requests.get')
-    def test_fetch_success(self, mock_get):
-        mresp = MagicMock()
-        mresp.json.return_value = {"ok": True}
-        mock_get.return_value = mresp
+def test_fetch_success(main_mod, mocked_requests_get):
+    mresp = Mock(content=b'{"ok": true}')
+    mocked_requests_get.return_value = mresp
 
-        data = main.fetch_bridge_state("http://1.2.3.4/api/user/", timeout=1.0)
-        self.assertEqual(data, {"ok": True})
-        mock_get.assert_called_once_with("http://1.2.3.4/api/user/", timeout=1.0)
+    data = main_mod.fetch_bridge_state("http://1.2.3.4/api/user/", timeout=1.0)
+    assert data == {"ok": True}
+    assert mocked_requests_get.call_count == 1
+    args, kwargs = mocked_requests_get.call_args
+    assert args == ("http://1.2.3.4/api/user/",)
+    assert kwargs == {"timeout": 1.0}
 
-    @patch('requests.get')
-    def test_fetch_invalid_json_raises(self, mock_get):
-        mresp = MagicMock()
-        mresp.json.side_effect = ValueError("bad json")
-        mock_get.return_value = mresp
 
-        with self.assertRaises(ValueError):
-            main.fetch_bridge_state("http://1.2.3.4/api/user/", timeout=0.1)
+def test_fetch_invalid_json_raises(main_mod, mocked_requests_get):
+    mresp = Mock(content=b"not json")
+    mocked_requests_get.return_value = mresp
 
-    @patch('requests.get', side_effect=requests.exceptions.Timeout("timeout"))
-    def test_fetch_timeout_bubbles(self, mock_get):
-        with self.assertRaises(requests.exceptions.RequestException):
-            main.fetch_bridge_state("http://1.2.3.4/api/user/", timeout=0.01)
+    with pytest.raises(ValueError):
+        main_mod.fetch_bridge_state("http://1.2.3.4/api/user/", timeout=0.1)
 
 
-if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+def test_fetch_timeout_bubbles(main_mod, mocked_requests_get):
+    mocked_requests_get.side_effect = requests.exceptions.Timeout("timeout")
+
+    with pytest.raises(requests.exceptions.RequestException):
+        main_mod.fetch_bridge_state("http://1.2.3.4/api/user/", timeout=0.01)
@@ -1,45 +1,68 @@
 import os
-import importlib
-import unittest
-from unittest.mock import patch, MagicMock
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import Mock
 
+import pytest
+
+
+# Built once and shared: main only reads .content, so tests never mutate it
+_BRIDGE_OK_RESP = Mock(content=b'{"bridge": "ok"}')
+
+# Run in a fresh interpreter: main is already imported here, so importing it again
+# would not execute any module-level code.
+_IMPORT_SCRIPT = """
+import requests
+
+def _no_network(*args, **kwargs):
+    raise AssertionError("network request during import")
+
+requests.Session.request = _no_network
 import main
+"""
+
+
+def test_import_without_env_has_no_side_effects():
+    # clean_hue_env has already removed the HUE_* variables from os.environ
+    result = subprocess.run(
+        [sys.executable, "-c", _IMPORT_SCRIPT],
+        cwd=Path(__file__).resolve().parent.parent,
+        env=dict(os.environ),
+        capture_output=True,
+        text=True,
+        timeout=30,
+    )
+    assert result.returncode == 0, result.stderr
+
+
+_SUCCESS_ENV = {
+    'HUE_USER_ID': 'user1234',
+    'HUE_BRIDGE_IP': '10.1.2.3',
+    'REQUEST_TIMEOUT': '0.5',
+    'LOG_LEVEL': 'DEBUG',
+}
+
+
+@pytest.mark.parametrize(
+    "env,rc,called",
+    [
+        ({}, 1, False),
+        (_SUCCESS_ENV, 0, True),
+    ],
+    ids=["main-without-user-id", "main-success"],
+)
+def test_main_behavior(main_mod, monkeypatch, mocked_requests_get, env, rc, called):
+    for name, value in env.items():
+        monkeypatch.setenv(name, value)
+    mocked_requests_get.return_value = _BRIDGE_OK_RESP
 
+    assert main_mod.main() == rc
 
-class TestImportAndMain(unittest.TestCase):
-    def test_import_without_env_does_not_raise_or_call_network(self):
-        with patch.dict(os.environ, {}, clear=True), patch('requests.get') as mock_get:
-            # Reload to simulate fresh import under cleared env
-            importlib.reload(main)
-            mock_get.assert_not_called()
-
-    def test_main_without_user_id_returns_1_and_no_network(self):
-        with patch.dict(os.environ, {}, clear=True), patch('requests.get') as mock_get:
-            importlib.reload(main)
-            rc = main.main()
-            self.assertEqual(rc, 1)
-            mock_get.assert_not_called()
-
-    def test_main_success_calls_fetch_and_returns_0(self):
-        with patch.dict(
-            os.environ,
-            {
-                'HUE_USER_ID': 'user1234',
-                'HUE_BRIDGE_IP': '10.1.2.3',
-                'REQUEST_TIMEOUT': '0.5',
-                'LOG_LEVEL': 'DEBUG',
-            },
-            clear=True,
-        ), patch('requests.get') as mock_get:
-            importlib.reload(main)
-            mresp = MagicMock()
-            mresp.json.return_value = {'bridge': 'ok'}
-            mock_get.return_value = mresp
-
-            rc = main.main()
-            self.assertEqual(rc, 0)
-            mock_get.assert_called_once_with('http://10.1.2.3/api/user1234/', timeout=0.5)
-
-
-if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+    if called:
+        assert mocked_requests_get.call_count == 1
+        args, kwargs = mocked_requests_get.call_args
+        assert args == ('http://10.1.2.3/api/user1234/',)
+        assert kwargs == {'timeout': 0.5}
+    else:
+        mocked_requests_get.assert_not_called()
@@ -0,0 +1,89 @@
+from unittest.mock import Mock
+
+
+BASE_URL = "http://1.2.3.4/api/user/"
+
+
+def _resp(content, status_code=200):
+    return Mock(content=content, status_code=status_code)
+
+
+def test_repeated_state_reads_within_ttl_hit_bridge_once(main_mod, mocked_requests_get):
+    mocked_requests_get.return_value = _resp(b'{"state": {"on": true, "bri": 100}}')
+
+    first = main_mod.get_light_state(BASE_URL, "1", timeout=1.0)
+    second = main_mod.get_light_state(BASE_URL, "1", timeout=1.0)
+
+    assert first == {"on": True, "bri": 100}
+    assert second == first
+    assert mocked_requests_get.call_count == 1
+    args, kwargs = mocked_requests_get.call_args
+    assert args == ("http://1.2.3.4/api/user/lights/1",)
+    assert kwargs == {"timeout": 1.0}
+
+
+def test_state_max_age_zero_bypasses_cache(main_mod, mocked_requests_get):
+    mocked_requests_get.return_value = _resp(b'{"state": {"on": true}}')
+
+    main_mod.get_light_state(BASE_URL, "1")
+    main_mod.get_light_state(BASE_URL, "1", max_age=0)
+
+    assert mocked_requests_get.call_count == 2
+
+
+def test_set_light_state_updates_cached_state(main_mod, mocked_requests_get, mocked_requests_put):
+    mocked_requests_get.return_value = _resp(b'{"state": {"on": false, "bri": 100, "hue": 10}}')
+    mocked_requests_put.return_value = _resp(
+        b'[{"success": {"/lights/1/state/on": true}}, {"success": {"/lights/1/state/bri": 200}},'
+        b' {"success": {"/lights/1/state/transitiontime": 4}}]'
+    )
+
+    main_mod.get_light_state(BASE_URL, "1")
+    main_mod.set_light_state(BASE_URL, "1", on=True, bri=200, transitiontime=4)
+    state = main_mod.get_light_state(BASE_URL, "1")
+
+    assert state == {"on": True, "bri": 200, "hue": 10}
+    mocked_requests_get.assert_called_once()
+
+
+def test_rejected_put_leaves_cached_state_alone(main_mod, mocked_requests_get, mocked_requests_put):
+    mocked_requests_get.return_value = _resp(b'{"state": {"on": true, "bri": 100}}')
+    mocked_requests_put.return_value = _resp(
+        b'[{"error": {"type": 201, "address": "/lights/1/state/bri", "description": "not modifiable"}}]'
+    )
+
+    main_mod.get_light_state(BASE_URL, "1")
+    main_mod.set_light_state(BASE_URL, "1", bri=10)
+
+    assert main_mod.get_light_state(BASE_URL, "1") == {"on": True, "bri": 100}
+
+
+def test_put_keeps_cache_fetch_time(main_mod, mocked_requests_get, mocked_requests_put):
+    mocked_requests_get.return_value = _resp(b'{"state": {"bri": 100}}')
+    mocked_requests_put.return_value = _resp(b'[{"success": {"/lights/1/state/bri": 10}}]')
+    state_url = BASE_URL + "lights/1/state"
+
+    main_mod.get_light_state(BASE_URL, "1")
+    fetched_at = main_mod._STATE_CACHE[state_url][0]
+    main_mod.set_light_state(BASE_URL, "1", bri=10)
+
+    assert main_mod._STATE_CACHE[state_url] == (fetched_at, {"bri": 10})
+
+
+_LIGHTS = b'{"1": {"name": "Kitchen"}, "2": {"name": " Living Room "}, "3": "bogus"}'
+
+
+def test_resolve_light_id_is_case_insensitive_and_cached(main_mod, mocked_requests_get):
+    mocked_requests_get.return_value = _resp(_LIGHTS)
+
+    assert main_mod.resolve_light_id_by_name(BASE_URL, "living room") == "2"
+    assert main_mod.resolve_light_id_by_name(BASE_URL, "KITCHEN") == "1"
+    mocked_requests_get.assert_called_once()
+
+
+def test_resolve_unknown_light_refetches_and_returns_none(main_mod, mocked_requests_get):
+    mocked_requests_get.return_value = _resp(_LIGHTS)
+
+    main_mod.resolve_light_id_by_name(BASE_URL, "Kitchen")
+    assert main_mod.resolve_light_id_by_name(BASE_URL, "Garage") is None
+    assert mocked_requests_get.call_count == 2
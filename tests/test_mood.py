@@ -0,0 +1,138 @@
+import contextlib
+from unittest.mock import Mock, call
+
+import pytest
+
+
+BASE_URL = "http://1.2.3.4/api/user/"
+STATE_URL = BASE_URL + "lights/1/state"
+
+
+@pytest.fixture
+def mood_session(main_mod, monkeypatch):
+    """A Mock session for _run_mood, with the shared rate limit and CLI args out of the way."""
+    monkeypatch.setattr(main_mod, "_bridge_slot", contextlib.nullcontext)
+    monkeypatch.setattr(main_mod.sys, "argv", ["main.py"])
+    session = Mock()
+    session.get.return_value = Mock(content=b'{"state": {"on": true, "bri": 50, "hue": 1000, "sat": 60}}')
+    session.put.return_value = Mock(content=b"[]", status_code=200)
+    return session
+
+
+def test_run_mood_puts_once_per_transition_then_restores(main_mod, monkeypatch, mood_session):
+    monkeypatch.setattr(main_mod.random, "randint", Mock(side_effect=[100, 200, 150, 300, 210, 250]))
+    monkeypatch.setattr(main_mod.random, "uniform", Mock(side_effect=[2.34, 12.0]))
+    stop_event = Mock()
+    stop_event.is_set.return_value = False
+    stop_event.wait.side_effect = [False, True]
+
+    main_mod._run_mood(
+        "Kitchen", BASE_URL, mood_session, timeout=1.0, stop_event=stop_event, restore_on_exit=True, light_id="1"
+    )
+
+    assert mood_session.get.call_count == 1
+    assert mood_session.put.call_args_list == [
+        call(STATE_URL, json={"on": True, "bri": 150, "hue": 100, "sat": 200, "transitiontime": 23}, timeout=1.0),
+        call(STATE_URL, json={"on": True, "bri": 250, "hue": 300, "sat": 210, "transitiontime": 120}, timeout=1.0),
+        call(STATE_URL, json={"on": True, "bri": 50, "hue": 1000, "sat": 60, "transitiontime": 0}, timeout=1.0),
+    ]
+
+
+def test_transitiontime_is_capped_at_bridge_maximum(main_mod, monkeypatch, mood_session):
+    monkeypatch.setattr(main_mod.random, "uniform", Mock(return_value=10_000.0))
+    stop_event = Mock()
+    stop_event.is_set.return_value = False
+    stop_event.wait.return_value = True
+
+    main_mod._run_mood(
+        "Kitchen", BASE_URL, mood_session, timeout=1.0, stop_event=stop_event, restore_on_exit=False, light_id="1"
+    )
+
+    args, kwargs = mood_session.put.call_args
+    assert kwargs["json"]["transitiontime"] == 65535
+
+
+def test_overrunning_put_resets_the_deadline_instead_of_bursting(main_mod, monkeypatch, mood_session):
+    clock = [0.0]
+    monkeypatch.setattr(main_mod, "time", Mock(monotonic=lambda: clock[0]))
+    put_seconds = iter([5.0, 0.5, 0.0])
+
+    def slow_put(*args, **kwargs):
+        clock[0] += next(put_seconds)
+        return Mock(content=b"[]", status_code=200)
+
+    mood_session.put.side_effect = slow_put
+    monkeypatch.setattr(main_mod.random, "uniform", Mock(side_effect=[2.0, 2.0]))
+    stop_event = Mock()
+    stop_event.is_set.return_value = False
+    stop_event.wait.return_value = True
+
+    main_mod._run_mood(
+        "Kitchen", BASE_URL, mood_session, timeout=1.0, stop_event=stop_event, restore_on_exit=True, light_id="1"
+    )
+
+    # The first PUT took 5 s of a 2 s transition, so pacing restarts at t=5 rather than
+    # at the missed t=2 deadline: the second transition waits 5 + 2 - 5.5 = 1.5 s.
+    assert stop_event.wait.call_args_list == [call(1.5)]
+    assert mood_session.put.call_count == 3
+
+
+def test_run_mood_application_logs_non_json_lights(main_mod, monkeypatch, mocked_requests_get, caplog):
+    monkeypatch.setenv("HUE_USER_ID", "user1234")
+    monkeypatch.setenv("HUE_BRIDGE_IP", "10.1.2.3")
+    mocked_requests_get.return_value = Mock(content=b"<html>busy</html>")
+    start = Mock()
+    monkeypatch.setattr(main_mod, "start_mood_thread", start)
+
+    with caplog.at_level("ERROR", logger="main"):
+        main_mod.run_mood_application()
+
+    assert "Failed to list bulbs from Hue Bridge" in caplog.text
+    start.assert_not_called()
+
+
+_LIGHTS = (
+    b'{"1": {"name": "Kitchen", "type": "Extended color light"},'
+    b' "2": {"name": "Hall", "type": "Dimmable light"}}'
+)
+
+
+@pytest.fixture
+def mood_app(main_mod, monkeypatch, mocked_requests_get):
+    """Environment and patches to run run_mood_application without threads or a terminal."""
+    monkeypatch.setenv("HUE_USER_ID", "user1234")
+    monkeypatch.setenv("HUE_BRIDGE_IP", "10.1.2.3")
+    monkeypatch.setattr(main_mod.sys, "argv", ["main.py"])
+    monkeypatch.setattr(main_mod, "_wait_for_escape_or_sigint", Mock())
+    mocked_requests_get.return_value = Mock(content=_LIGHTS)
+    start = Mock()
+    monkeypatch.setattr(main_mod, "start_mood_thread", start)
+    return start
+
+
+def test_run_mood_application_fetches_lights_once_and_passes_ids(
+    main_mod, monkeypatch, mocked_requests_get, mood_app
+):
+    monkeypatch.setenv("HUE_MOOD_BULBS", "Kitchen,Garage,hall")
+
+    main_mod.run_mood_application()
+
+    assert mocked_requests_get.call_count == 1
+    args, kwargs = mocked_requests_get.call_args
+    assert args == ("http://10.1.2.3/api/user1234/lights",)
+    started = [(c.args[0], c.kwargs["light_id"]) for c in mood_app.call_args_list]
+    assert started == [("Kitchen", "1"), ("hall", "2")]
+    assert main_mod._LIGHT_INDEX_CACHE["http://10.1.2.3/api/user1234/"] == {"kitchen": "1", "hall": "2"}
+    stop_event = mood_app.call_args.args[1]
+    assert stop_event.is_set()
+
+
+def test_run_mood_application_returns_when_no_bulb_is_found(main_mod, monkeypatch, mood_app, caplog):
+    monkeypatch.setenv("HUE_MOOD_BULBS", "Garage")
+
+    with caplog.at_level("WARNING", logger="main"):
+        main_mod.run_mood_application()
+
+    assert "None of the selected bulbs were found" in caplog.text
+    mood_app.assert_not_called()
+    main_mod._wait_for_escape_or_sigint.assert_not_called()
@@ -0,0 +1,52 @@
+import threading
+from unittest.mock import Mock
+
+import pytest
+
+
+@pytest.fixture
+def fake_time(main_mod, monkeypatch):
+    """Replace main's clock with one that only advances when main sleeps."""
+    clock = [0.0]
+
+    def sleep(seconds):
+        clock[0] += seconds
+
+    fake = Mock(monotonic=lambda: clock[0], sleep=Mock(side_effect=sleep))
+    monkeypatch.setattr(main_mod, "time", fake)
+    return fake
+
+
+def test_token_bucket_allows_a_burst_of_capacity_without_sleeping(main_mod, fake_time):
+    bucket = main_mod._TokenBucket(rate=20.0, capacity=4)
+
+    for _ in range(4):
+        bucket.acquire()
+
+    fake_time.sleep.assert_not_called()
+
+
+def test_token_bucket_sleeps_one_interval_once_empty(main_mod, fake_time):
+    bucket = main_mod._TokenBucket(rate=20.0, capacity=4)
+    for _ in range(4):
+        bucket.acquire()
+
+    bucket.acquire()
+
+    assert fake_time.sleep.call_count == 1
+    args, kwargs = fake_time.sleep.call_args
+    assert args == (pytest.approx(1 / 20.0),)
+
+
+def test_bridge_slot_releases_in_flight_slot_when_body_raises(main_mod, monkeypatch):
+    semaphore = threading.BoundedSemaphore(1)
+    monkeypatch.setattr(main_mod, "_IN_FLIGHT", semaphore)
+    monkeypatch.setattr(main_mod, "_PUT_RATE", Mock())
+
+    with pytest.raises(RuntimeError):
+        with main_mod._bridge_slot():
+            raise RuntimeError("PUT failed")
+
+    assert semaphore.acquire(blocking=False)
+    semaphore.release()
+    main_mod._PUT_RATE.acquire.assert_called_once_with()
@@ -1,20 +1,13 @@
-import unittest
+import pytest
 
-import importlib
 
-class TestBuildBaseUrl(unittest.TestCase):
-    def setUp(self):
-        # Ensure we import the latest main module
-        self.main = importlib.import_module('main')
+# (user_id, bridge_ip, expected base URL); strings are accepted without validation by design
+_CASES = (
+    ("user1234", "10.0.0.2", "http://10.0.0.2/api/user1234/"),
+    ("abc", "192.168.1.2", "http://192.168.1.2/api/abc/"),
+)
 
-    def test_build_base_url(self):
-        url = self.main.build_base_url("user1234", "10.0.0.2")
-        self.assertEqual(url, "http://10.0.0.2/api/user1234/")
 
-    def test_build_base_url_with_ip_like(self):
-        # Accepts strings; no validation here by design
-        url = self.main.build_base_url("abc", "192.168.1.2")
-        self.assertEqual(url, "http://192.168.1.2/api/abc/")
-
-if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+@pytest.mark.parametrize("user_id,bridge_ip,expected", _CASES)
+def test_build_base_url(main_mod, user_id, bridge_ip, expected):
+    assert main_mod.build_base_url(user_id, bridge_ip) == expected